@@ -7,10 +7,48 @@ and printed after each round.
 from __future__ import annotations
 
 import random
-from typing import Literal
+from typing import Iterable, Iterator, Literal, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
 
 Move = Literal["rock", "paper", "scissors"]
 
+_MOVES: tuple[Move, ...] = ("rock", "paper", "scissors")
+
+# generator used by the CLI; the GUI passes its own instance
+_rng = random.Random()
+
+# precomputed result for every (player, computer) pair
+_OUTCOME: dict[tuple[str, str], str] = {
+    ("rock", "rock"): "tie",
+    ("rock", "scissors"): "player",
+    ("rock", "paper"): "computer",
+    ("paper", "paper"): "tie",
+    ("paper", "rock"): "player",
+    ("paper", "scissors"): "computer",
+    ("scissors", "scissors"): "tie",
+    ("scissors", "paper"): "player",
+    ("scissors", "rock"): "computer",
+}
+
+# accepted spellings for each move, and the words that end the game
+_ALIAS: dict[str, str] = {
+    "rock": "rock",
+    "r": "rock",
+    "paper": "paper",
+    "p": "paper",
+    "scissors": "scissors",
+    "scissor": "scissors",
+    "s": "scissors",
+}
+_QUIT = frozenset({"quit", "q", "exit"})
+
+# integer encoding used by determine_winner_batch
+_MOVE_TO_INT: dict[str, int] = {"rock": 0, "paper": 1, "scissors": 2}
+
 
 def normalize_move(raw: str) -> str | None:
     """Normalize user input into 'rock', 'paper', or 'scissors'.
@@ -20,15 +58,9 @@ def normalize_move(raw: str) -> str | None:
     if not raw:
         return None
     s = raw.strip().lower()
-    if s in ("quit", "q", "exit"):
+    if s in _QUIT:
         return None
-    if s in ("rock", "r"):
-        return "rock"
-    if s in ("paper", "p"):
-        return "paper"
-    if s in ("scissors", "scissor", "s"):
-        return "scissors"
-    return ""  # invalid marker
+    return _ALIAS.get(s, "")  # "" is the invalid marker
 
 
 def determine_winner(player: Move, computer: Move) -> str:
@@ -39,21 +71,47 @@ def determine_winner(player: Move, computer: Move) -> str:
     - Scissors beats Paper
     - Paper beats Rock
     """
-    if player == computer:
-        return "tie"
+    return _OUTCOME[(player, computer)]
+
+
+def determine_winner_batch(players: Sequence[int], computers: Sequence[int]) -> np.ndarray | list[int]:
+    """Return outcome codes for many rounds at once.
+
+    Moves are encoded as 0=rock, 1=paper, 2=scissors (see `_MOVE_TO_INT`).
+    Each result is 0 for a tie, 1 when the player wins and 2 when the
+    computer wins. Uses a NumPy int8 array when numpy is installed and a
+    plain list otherwise.
+
+    Raises ValueError if the two sequences differ in length.
+    """
+    if len(players) != len(computers):
+        raise ValueError(f"got {len(players)} player moves but {len(computers)} computer moves")
+    if np is not None:
+        p = np.asarray(players, dtype=np.int8)
+        c = np.asarray(computers, dtype=np.int8)
+        return ((p - c) % 3).astype(np.int8)
+    return [(p - c) % 3 for p, c in zip(players, computers)]
 
-    wins = {
-        ("rock", "scissors"),
-        ("scissors", "paper"),
-        ("paper", "rock"),
-    }
-    if (player, computer) in wins:
-        return "player"
-    return "computer"
 
+def random_move(rng: random.Random = _rng) -> Move:
+    """Pick a uniformly random move using `rng`.
 
-def random_move() -> Move:
-    return random.choice(["rock", "paper", "scissors"])
+    Draws two random bits and rejects the fourth value, which is cheaper than
+    `randrange(3)` for a fixed three-way choice.
+    """
+    r = rng.getrandbits(2)
+    while r == 3:
+        r = rng.getrandbits(2)
+    return _MOVES[r]
+
+
+def _coerce_scores(values: Iterable[object]) -> Iterator[int]:
+    """Yield each value as an int, skipping anything that does not convert."""
+    for x in values:
+        try:
+            yield int(x)  # type: ignore[call-overload]
+        except (TypeError, ValueError, OverflowError):
+            pass
 
 
 def main() -> None:
@@ -5,18 +5,35 @@ and tests stay in one place.
 """
 from __future__ import annotations
 
+import heapq
+import json
+import os
+import queue
 import random
-import platform
+import threading
 import tkinter as tk
+from contextlib import contextmanager
+from pathlib import Path
 from tkinter import ttk
-from typing import Literal, cast
+from typing import Iterator, Literal
 
 try:
     # local import when running from this folder
-    from rock_paper_scissors import determine_winner
+    from rock_paper_scissors import _MOVES, _coerce_scores, determine_winner, random_move
 except Exception:  # pragma: no cover - allow running from different cwd
     # fallback for package-style imports
-    from .rock_paper_scissors import determine_winner  # type: ignore
+    from .rock_paper_scissors import _MOVES, _coerce_scores, determine_winner, random_move  # type: ignore
+
+try:
+    # optional sound backend (Windows only)
+    import winsound as _winsound
+except ImportError:
+    _winsound = None
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    _orjson = None
 
 Move = Literal["rock", "paper", "scissors"]
 
@@ -24,40 +41,71 @@ Move = Literal["rock", "paper", "scissors"]
 ICON_SIZE = 64
 
 
-def draw_icon_on(canvas: tk.Canvas, move: Move) -> None:
-    """Draw a simple representative icon for a move on the given canvas."""
-    canvas.delete("all")
-    w = ICON_SIZE
-    h = ICON_SIZE
-    if move == "rock":
-        # gray circle
-        canvas.create_oval(6, 6, w - 6, h - 6, fill="#7f8c8d", outline="#2c3e50", width=2)
-        # emoji overlay
-        canvas.create_text(w // 2, h // 2, text="✊", font=("Segoe UI Emoji", 28))
-    elif move == "paper":
-        # white rectangle with shadow
-        canvas.create_rectangle(8, 8, w - 8, h - 8, fill="#ecf0f1", outline="#7f8c8d", width=2)
-        canvas.create_line(12, 18, w - 12, 18, fill="#bdc3c7")
-        canvas.create_line(12, 28, w - 12, 28, fill="#bdc3c7")
-        canvas.create_text(w // 2, h // 2, text="✋", font=("Segoe UI Emoji", 28))
-    else:  # scissors
-        # two crossing blades
-        canvas.create_line(12, 16, w - 12, h - 16, fill="#f1c40f", width=6, capstyle="round")
-        canvas.create_line(12, h - 16, w - 12, 16, fill="#e67e22", width=6, capstyle="round")
-        canvas.create_oval(w // 2 - 6, h // 2 - 6, w // 2 + 6, h // 2 + 6, fill="#ecf0f1", outline="#bdc3c7")
-        canvas.create_text(w // 2, h // 2, text="✌️", font=("Segoe UI Emoji", 26))
+_W = _H = ICON_SIZE
+
+# shape calls (canvas method, coords, options) that make up each move's icon
+_ICON_PLAN: dict[Move, tuple[tuple[str, tuple[int, ...], dict], ...]] = {
+    # gray circle with emoji overlay
+    "rock": (
+        ("create_oval", (6, 6, _W - 6, _H - 6), {"fill": "#7f8c8d", "outline": "#2c3e50", "width": 2}),
+        ("create_text", (_W // 2, _H // 2), {"text": "✊", "font": ("Segoe UI Emoji", 28)}),
+    ),
+    # white rectangle with ruled lines
+    "paper": (
+        ("create_rectangle", (8, 8, _W - 8, _H - 8), {"fill": "#ecf0f1", "outline": "#7f8c8d", "width": 2}),
+        ("create_line", (12, 18, _W - 12, 18), {"fill": "#bdc3c7"}),
+        ("create_line", (12, 28, _W - 12, 28), {"fill": "#bdc3c7"}),
+        ("create_text", (_W // 2, _H // 2), {"text": "✋", "font": ("Segoe UI Emoji", 28)}),
+    ),
+    # two crossing blades
+    "scissors": (
+        ("create_line", (12, 16, _W - 12, _H - 16), {"fill": "#f1c40f", "width": 6, "capstyle": "round"}),
+        ("create_line", (12, _H - 16, _W - 12, 16), {"fill": "#e67e22", "width": 6, "capstyle": "round"}),
+        ("create_oval", (_W // 2 - 6, _H // 2 - 6, _W // 2 + 6, _H // 2 + 6), {"fill": "#ecf0f1", "outline": "#bdc3c7"}),
+        ("create_text", (_W // 2, _H // 2), {"text": "✌️", "font": ("Segoe UI Emoji", 26)}),
+    ),
+}
+
+
+def _prebuild_icons(canvas: tk.Canvas) -> None:
+    """Create the items for every move once, hidden and tagged with the move name.
+
+    Switching icons is then a matter of toggling the ``state`` of a tag group
+    instead of deleting and recreating canvas items.
+    """
+    for move, plan in _ICON_PLAN.items():
+        for method_name, coords, opts in plan:
+            getattr(canvas, method_name)(*coords, tags=move, state="hidden", **opts)
+
+
+# status line templates, formatted with p=player move and c=computer move
+_TIE_TEXT = "Tie — both chose {p}"
+_WIN_TEXT = "You win — {p} beats {c}"
+_LOSE_TEXT = "Computer wins — {c} beats {p}"
 
 
 class RPSApp(tk.Tk):
     """
     Refactored RPSApp with small efficiency improvements and a High Scores feature.
     - Uses StringVar for text updates to avoid repeated .config calls.
-    - Avoids redrawing icons when the move hasn't changed.
+    - Builds icon items once per canvas and only toggles their visibility.
     - Persists top N high scores (player-only) in a JSON file in the user's home dir.
     - Adds a High Scores label and a button to clear saved high scores.
     """
     HIGH_SCORES_FILE = ".rps_high_scores.json"
     MAX_HIGH_SCORES = 5
+    # keyboard shortcut -> move
+    _KEY_DISPATCH: dict[str, Move] = {"r": "rock", "p": "paper", "s": "scissors"}
+    # status text for every (player, computer) pair, split by round outcome
+    _STATUS_TIE: dict[tuple[Move, Move], str] = {(m, m): _TIE_TEXT.format(p=m, c=m) for m in _MOVES}
+    _STATUS_WIN: dict[tuple[Move, Move], str] = {
+        (p, c): _WIN_TEXT.format(p=p, c=c)
+        for p in _MOVES for c in _MOVES if determine_winner(p, c) == "player"
+    }
+    _STATUS_LOSE: dict[tuple[Move, Move], str] = {
+        (p, c): _LOSE_TEXT.format(p=p, c=c)
+        for p in _MOVES for c in _MOVES if determine_winner(p, c) == "computer"
+    }
 
     def __init__(self) -> None:
         super().__init__()
@@ -67,19 +115,21 @@ class RPSApp(tk.Tk):
 
         self.player_score = 0
         self.computer_score = 0
+        # per-app generator for computer moves
+        self._rng = random.Random()
 
         # cached last moves to avoid unnecessary redraws
         self._last_player_move: Move | None = None
         self._last_comp_move: Move | None = None
 
         # optional sound backend (Windows winsound)
-        self._winsound = None
-        try:
-            if platform.system() == "Windows":
-                import winsound as _wins
-                self._winsound = _wins
-        except Exception:
-            self._winsound = None
+        self._winsound = _winsound
+        # whether the window has focus; flash and sound are skipped in the background
+        self._active = True
+
+        # deferred StringVar writes while inside _batched_updates(), keyed by Tcl name
+        self._batch_depth = 0
+        self._pending_vars: dict[str, tuple[tk.StringVar, str]] = {}
 
         # UI text variables for efficient updates
         self.status_var = tk.StringVar(value="Choose rock, paper or scissors")
@@ -89,21 +139,27 @@ class RPSApp(tk.Tk):
 
         # high scores persistence path (home dir)
         try:
-            from pathlib import Path
             self._hs_path = Path.home() / self.HIGH_SCORES_FILE
         except Exception:
             self._hs_path = None
 
+        # high scores are written by a background thread so slow disks never block the UI
+        self._hs_queue: queue.SimpleQueue[list[int] | None] = queue.SimpleQueue()
+        self._hs_writer: threading.Thread | None = None
+        if self._hs_path:
+            self._hs_writer = threading.Thread(target=self._hs_worker, daemon=True)
+            self._hs_writer.start()
+
         # load persisted high scores
         self._high_scores: list[int] = []
+        # set when the in-memory list differs from what is on disk
+        self._hs_dirty = False
         self._load_high_scores()
         self._update_high_var()
 
         self._build_ui()
 
     def _build_ui(self) -> None:
-        from functools import partial
-
         pad = 12
         frm = ttk.Frame(self, padding=pad)
         frm.grid(row=0, column=0)
@@ -126,9 +182,19 @@ class RPSApp(tk.Tk):
         self.vs_label.grid(row=1, column=1)
         self.computer_canvas.grid(row=1, column=2, padx=8)
 
+        # create all icon items up front; moves only toggle visibility
+        _prebuild_icons(self.player_canvas)
+        _prebuild_icons(self.computer_canvas)
+
         # status and score (use StringVar)
         self.status = ttk.Label(frm, textvariable=self.status_var, anchor="center")
         self.status.grid(row=2, column=0, columnspan=3, pady=(pad // 2, pad))
+        # original background, restored after each result flash
+        try:
+            self._status_bg = self.status.cget("background")
+        except Exception:
+            self._status_bg = ""
+        self._flash_job: str | None = None
 
         self.score_label = ttk.Label(frm, textvariable=self.score_var)
         self.score_label.grid(row=3, column=0, columnspan=3, pady=(0, pad))
@@ -145,10 +211,10 @@ class RPSApp(tk.Tk):
         btn_frame = ttk.Frame(frm)
         btn_frame.grid(row=5, column=0, columnspan=3)
 
-        # use partial to avoid repeated lambdas
-        btn_rock = ttk.Button(btn_frame, text="Rock", command=partial(self.play, "rock"))
-        btn_paper = ttk.Button(btn_frame, text="Paper", command=partial(self.play, "paper"))
-        btn_scissors = ttk.Button(btn_frame, text="Scissors", command=partial(self.play, "scissors"))
+        # bound methods avoid a partial/lambda indirection per click
+        btn_rock = ttk.Button(btn_frame, text="Rock", command=self._play_rock)
+        btn_paper = ttk.Button(btn_frame, text="Paper", command=self._play_paper)
+        btn_scissors = ttk.Button(btn_frame, text="Scissors", command=self._play_scissors)
         btn_reset = ttk.Button(btn_frame, text="Reset Scores", command=self.reset_scores)
         btn_quit = ttk.Button(btn_frame, text="Quit", command=self._on_quit)
 
@@ -160,78 +226,128 @@ class RPSApp(tk.Tk):
 
         # keyboard shortcuts: handle both lower/upper case via single key handler
         self.bind_all("<Key>", self._on_key)
+        # track focus so background rounds skip the flash and sound
+        self.bind("<FocusIn>", self._on_focus_in)
+        self.bind("<FocusOut>", self._on_focus_out)
 
         # initialize default icons
-        self._draw_player_if_changed("rock")
-        self._draw_comp_if_changed("rock")
+        self._draw_pair("rock", "rock")
 
     def _on_key(self, event: tk.Event) -> None:
-        c = (event.char or "").lower()
-        if c == "r":
-            self.play("rock")
-        elif c == "p":
-            self.play("paper")
-        elif c == "s":
-            self.play("scissors")
+        move = self._KEY_DISPATCH.get((event.char or "").lower())
+        if move is not None:
+            self.play(move)
+
+    def _play_rock(self) -> None:
+        self.play("rock")
+
+    def _play_paper(self) -> None:
+        self.play("paper")
+
+    def _play_scissors(self) -> None:
+        self.play("scissors")
+
+    def _on_focus_in(self, event: tk.Event) -> None:
+        self._active = True
+
+    def _on_focus_out(self, event: tk.Event) -> None:
+        self._active = False
 
     def _score_text(self) -> str:
         return f"You: {self.player_score}  Computer: {self.computer_score}"
 
+    @contextmanager
+    def _batched_updates(self) -> Iterator[None]:
+        """Defer _set_var writes until the outermost block exits, then lay out once."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                pending = self._pending_vars
+                self._pending_vars = {}
+                for var, value in pending.values():
+                    var.set(value)
+                self.update_idletasks()
+
+    def _set_var(self, var: tk.StringVar, value: str) -> None:
+        if self._batch_depth > 0:
+            self._pending_vars[str(var)] = (var, value)
+        else:
+            var.set(value)
+
     def play(self, player_move: Move) -> None:
-        # ensure the chosen move is typed as Move for static checkers
-        comp_move = cast(Move, random.choice(["rock", "paper", "scissors"]))
+        with self._batched_updates():
+            self._play_round(player_move)
+
+    def _play_round(self, player_move: Move) -> None:
+        comp_move = random_move(self._rng)
         winner = determine_winner(player_move, comp_move)
 
-        # update icon canvases (methods handle change detection)
-        self._draw_player_if_changed(player_move)
-        self._draw_comp_if_changed(comp_move)
+        # update icon canvases; only canvases whose move changed are touched
+        self._draw_pair(player_move, comp_move)
 
+        pair = (player_move, comp_move)
         if winner == "tie":
-            text = f"Tie — both chose {player_move}"
+            text = self._STATUS_TIE.get(pair) or _TIE_TEXT.format(p=player_move, c=comp_move)
             self._play_sound("tie")
         elif winner == "player":
             self.player_score += 1
-            text = f"You win — {player_move} beats {comp_move}"
+            text = self._STATUS_WIN.get(pair) or _WIN_TEXT.format(p=player_move, c=comp_move)
             self._play_sound("win")
             # high scores are updated only on reset or quit
         else:
             self.computer_score += 1
-            text = f"Computer wins — {comp_move} beats {player_move}"
+            text = self._STATUS_LOSE.get(pair) or _LOSE_TEXT.format(p=player_move, c=comp_move)
             self._play_sound("lose")
 
-        self.status_var.set(text)
+        self._set_var(self.status_var, text)
         # Trigger a brief status label flash to indicate result
         self._flash_status()
         new_score = self._score_text()
         if new_score != self._last_score_text:
-            self.score_var.set(new_score)
+            self._set_var(self.score_var, new_score)
             self._last_score_text = new_score
 
     def reset_scores(self) -> None:
         # persist current player score into high scores before resetting
-        self._maybe_update_high_scores(force_save=True)
-        self.player_score = 0
-        self.computer_score = 0
-        self.score_var.set(self._score_text())
+        with self._batched_updates():
+            self._maybe_update_high_scores()
+            self._flush_high_scores()
+            self.player_score = 0
+            self.computer_score = 0
+            self._last_score_text = self._score_text()
+            self._set_var(self.score_var, self._last_score_text)
 
     def _on_quit(self) -> None:
         # persist before exit
-        self._maybe_update_high_scores(force_save=True)
+        self._maybe_update_high_scores()
+        self._flush_high_scores()
+        # let the writer drain pending saves before exiting
+        if self._hs_writer:
+            self._hs_queue.put(None)
+            self._hs_writer.join(timeout=0.5)
         self.destroy()
 
-    def _draw_player_if_changed(self, move: Move) -> None:
-        if move != self._last_player_move:
-            draw_icon_on(self.player_canvas, move)
-            self._last_player_move = move
-
-    def _draw_comp_if_changed(self, move: Move) -> None:
-        if move != self._last_comp_move:
-            draw_icon_on(self.computer_canvas, move)
-            self._last_comp_move = move
+    def _draw_pair(self, player_move: Move, comp_move: Move) -> None:
+        """Show the icons for both moves, touching only canvases whose move changed."""
+        if player_move != self._last_player_move:
+            self._show_icon(self.player_canvas, player_move, self._last_player_move)
+            self._last_player_move = player_move
+        if comp_move != self._last_comp_move:
+            self._show_icon(self.computer_canvas, comp_move, self._last_comp_move)
+            self._last_comp_move = comp_move
+
+    def _show_icon(self, canvas: tk.Canvas, move: Move, previous: Move | None) -> None:
+        """Hide the previously shown icon group on `canvas` and show the one for `move`."""
+        if previous is not None:
+            canvas.itemconfigure(previous, state="hidden")
+        canvas.itemconfigure(move, state="normal")
 
     def _play_sound(self, result: str) -> None:
         """Play a short sound for win/lose/tie when available (Windows only)."""
-        if not self._winsound:
+        if not self._winsound or not self._active:
             return
         try:
             if result == "win":
@@ -249,28 +365,24 @@ class RPSApp(tk.Tk):
             pass
 
     def _flash_status(self, flashes: int = 3) -> None:
-        """Flash the status label background a few times to show result."""
-        original_bg = None
+        """Highlight the status label briefly to show the result."""
+        if flashes <= 0 or not self._active:
+            return
+        # restart the highlight if a previous flash is still pending
+        if self._flash_job is not None:
+            self.after_cancel(self._flash_job)
         try:
-            original_bg = self.status.cget("background")
+            self.status.configure(background="#f1c40f")
         except Exception:
-            original_bg = ""
-        highlight = "#f1c40f"
-
-        def _do_flash(n: int) -> None:
-            if n <= 0:
-                try:
-                    self.status.configure(background=original_bg)
-                except Exception:
-                    pass
-                return
-            try:
-                self.status.configure(background=highlight if n % 2 == 1 else original_bg)
-            except Exception:
-                pass
-            self.after(150, _do_flash, n - 1)
+            return
+        self._flash_job = self.after(flashes * 150, self._end_flash)
 
-        _do_flash(flashes * 2)
+    def _end_flash(self) -> None:
+        self._flash_job = None
+        try:
+            self.status.configure(background=self._status_bg)
+        except Exception:
+            pass
 
     # ---------------- High Scores persistence ----------------
     def _load_high_scores(self) -> None:
@@ -278,51 +390,76 @@ class RPSApp(tk.Tk):
         if not self._hs_path:
             return
         try:
-            import json
             if self._hs_path.exists():
-                data = json.loads(self._hs_path.read_text(encoding="utf-8"))
+                raw = self._hs_path.read_bytes()
+                data = _orjson.loads(raw) if _orjson else json.loads(raw)
                 if isinstance(data, list):
-                    # sanitize to ints
-                    self._high_scores = sorted([int(x) for x in data if isinstance(x, (int, float))], reverse=True)[: self.MAX_HIGH_SCORES]
+                    # sanitize to ints in a single pass
+                    self._high_scores = heapq.nlargest(self.MAX_HIGH_SCORES, _coerce_scores(data))
         except Exception:
             self._high_scores = []
 
     def _save_high_scores(self) -> None:
+        """Queue a snapshot of the high scores for the background writer."""
+        if self._hs_writer:
+            self._hs_queue.put(list(self._high_scores))
+
+    def _hs_worker(self) -> None:
+        """Write queued high-score snapshots until the None sentinel arrives."""
+        while True:
+            scores = self._hs_queue.get()
+            if scores is None:
+                return
+            self._write_high_scores(scores)
+
+    def _write_high_scores(self, scores: list[int]) -> None:
+        """Write scores to a temp file and swap it in, so an interrupted write keeps the old file."""
         if not self._hs_path:
             return
+        tmp = self._hs_path.with_name(self._hs_path.name + ".tmp")
         try:
-            import json
-            self._hs_path.write_text(json.dumps(self._high_scores), encoding="utf-8")
+            if _orjson:
+                tmp.write_bytes(_orjson.dumps(scores))
+            else:
+                tmp.write_bytes(json.dumps(scores).encode("utf-8"))
+            os.replace(tmp, self._hs_path)
         except Exception:
             pass
 
     def _update_high_var(self) -> None:
         if not self._high_scores:
-            self.high_var.set("High Scores: —")
+            self._set_var(self.high_var, "High Scores: —")
         else:
-            self.high_var.set("High Scores: " + ", ".join(str(x) for x in self._high_scores))
+            self._set_var(self.high_var, "High Scores: " + ", ".join(str(x) for x in self._high_scores))
 
-    def _maybe_update_high_scores(self, force_save: bool = False) -> None:
+    def _maybe_update_high_scores(self) -> None:
         """
         Add current player_score to high scores if it qualifies.
-        If force_save is True, will write file even if no change (used on reset/quit).
+        Marks the list dirty on change; callers persist it with _flush_high_scores.
         """
         changed = False
         ps = int(self.player_score)
         if ps > 0:
             if not self._high_scores or ps > min(self._high_scores) or len(self._high_scores) < self.MAX_HIGH_SCORES:
-                # insert and keep top N unique values
-                self._high_scores.append(ps)
-                self._high_scores = sorted(set(self._high_scores), reverse=True)[: self.MAX_HIGH_SCORES]
-                changed = True
-        if changed or force_save:
-            self._save_high_scores()
+                # insert and keep top N unique values; a score already listed changes nothing
+                new = heapq.nlargest(self.MAX_HIGH_SCORES, set(self._high_scores) | {ps})
+                if new != self._high_scores:
+                    self._high_scores = new
+                    changed = True
         if changed:
+            self._hs_dirty = True
             self._update_high_var()
 
+    def _flush_high_scores(self) -> None:
+        """Write high scores to disk only if they changed since the last save."""
+        if self._hs_dirty:
+            self._save_high_scores()
+            self._hs_dirty = False
+
     def _clear_high_scores(self) -> None:
         self._high_scores = []
-        self._save_high_scores()
+        self._hs_dirty = True
+        self._flush_high_scores()
         self._update_high_var()
 
 
@@ -1,7 +1,8 @@
-"""Unit tests for rock_paper_scissors.determine_winner and normalize_move."""
+"""Unit tests for rock_paper_scissors.determine_winner(_batch) and normalize_move."""
+import random
 import unittest
 
-from rock_paper_scissors import determine_winner, normalize_move
+from rock_paper_scissors import _MOVE_TO_INT, _coerce_scores, np, determine_winner, determine_winner_batch, normalize_move, random_move
 
 
 class TestRPS(unittest.TestCase):
@@ -21,6 +22,29 @@ class TestRPS(unittest.TestCase):
         self.assertEqual(determine_winner("paper", "scissors"), "computer")
         self.assertEqual(determine_winner("rock", "paper"), "computer")
 
+    def test_determine_winner_batch_matches_scalar(self):
+        moves = ["rock", "paper", "scissors"]
+        codes = {0: "tie", 1: "player", 2: "computer"}
+        players = [p for p in moves for _ in moves]
+        computers = [c for _ in moves for c in moves]
+        results = determine_winner_batch(
+            [_MOVE_TO_INT[p] for p in players], [_MOVE_TO_INT[c] for c in computers]
+        )
+        for p, c, r in zip(players, computers, results):
+            self.assertEqual(codes[int(r)], determine_winner(p, c))
+
+    @unittest.skipUnless(np, "numpy not installed")
+    def test_determine_winner_batch_numpy(self):
+        results = determine_winner_batch(np.array([0, 1, 2]), np.array([2, 2, 2]))
+        self.assertEqual(results.dtype, np.int8)
+        self.assertEqual(results.tolist(), [1, 2, 0])
+
+    def test_determine_winner_batch_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            determine_winner_batch([0, 1, 2], [0, 1])
+        with self.assertRaises(ValueError):
+            determine_winner_batch([0, 1, 2], [0])
+
     def test_normalize_move_variants(self):
         self.assertEqual(normalize_move("rock"), "rock")
         self.assertEqual(normalize_move("R"), "rock")
@@ -30,6 +54,15 @@ class TestRPS(unittest.TestCase):
         self.assertIsNone(normalize_move("quit"))
         self.assertEqual(normalize_move("unknown"), "")
 
+    def test_random_move_covers_all_moves(self):
+        rng = random.Random(0)
+        seen = {random_move(rng) for _ in range(100)}
+        self.assertEqual(seen, {"rock", "paper", "scissors"})
+
+    def test_coerce_scores_skips_unconvertible(self):
+        data = [3, "7", 2.9, None, "x", float("inf"), float("nan")]
+        self.assertEqual(list(_coerce_scores(data)), [3, 7, 2])
+
 
 if __name__ == "__main__":
     unittest.main()